@@ -1,4 +1,10 @@
 # data_indexing/__init__.py
 # empty version info
 
-__version__ = "0.1.0"
\ No newline at end of file
+__version__ = "0.1.0"
+
+# Canonical home of configuration access: import get_env_var from the
+# package root rather than re-implementing env handling per module.
+from data_indexing.utils import get_env_var
+
+__all__ = ["get_env_var", "__version__"]
@@ -5,99 +5,225 @@ import unicodedata
 import re
 import string
 from spellchecker import SpellChecker
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from collections import Counter
-from uuid import uuid4
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from uuid import NAMESPACE_URL, uuid5
+from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
-from functools import partial
+import threading
 
 logger = logging.getLogger(__name__)
 
-def enrich_chunks(documents: list[dict]) -> list[dict]:
+# Built once at import: rebuilding the stopword set and punctuation table per
+# chunk pays the NLTK corpus lookup and set construction on every call.
+_STOPWORDS = frozenset(stopwords.words('english'))
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Tokenizer for the fused enrichment pass: the text is lowercased ASCII by the
+# time it runs, so matching alphanumeric runs drops punctuation for free.
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Word tokenizer for the standalone helpers. Punkt-based word_tokenize loads a
+# pickled model and does sentence segmentation that downstream filtering throws
+# away anyway; a compiled regex over alphabetic runs is an order of magnitude
+# faster on short chunks.
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z']*")
+
+# Known-words set and correction memo for spell checking. The frozenset lookup
+# is much cheaper than SpellChecker.__contains__, and corrections are cached so
+# a typo repeated across chunks pays the edit-distance search only once.
+_KNOWN_WORDS = None
+_CORRECTION_CACHE: dict[str, str] = {}
+
+# Per-process spell checker. Constructing SpellChecker parses the ~200k-word
+# frequency dictionary, so it must happen once per worker process rather than
+# once per document.
+_SPELL = None
+
+def _init_worker():
+    """
+    Initializes per-process enrichment state in pool worker processes.
+
+    When workers are forked, the spell checker and known-words set built in
+    the parent are inherited through copy-on-write pages and this is a no-op;
+    under spawn-style start methods each worker builds its own copy once.
+    """
+    _known_words(_get_spell())
+
+def _get_spell() -> SpellChecker:
+    """Returns the process-local spell checker, creating it on first use."""
+    global _SPELL
+    if _SPELL is None:
+        _SPELL = SpellChecker()
+    return _SPELL
+
+def _known_words(spell: SpellChecker) -> frozenset:
+    """Returns the spell checker's dictionary keys as a cached frozenset."""
+    global _KNOWN_WORDS
+    if _KNOWN_WORDS is None:
+        _KNOWN_WORDS = frozenset(spell.word_frequency.dictionary.keys())
+    return _KNOWN_WORDS
+
+def _correct_word(token: str, spell: SpellChecker) -> str:
+    """Returns the memoized spelling correction for an out-of-dictionary token."""
+    corrected = _CORRECTION_CACHE.get(token)
+    if corrected is None:
+        corrected = spell.correction(token) or token
+        _CORRECTION_CACHE[token] = corrected
+    return corrected
+
+def enrich_chunks(documents: list[dict]) -> Iterator[dict]:
     """
     Enriches document chunks with text preprocessing and keyword extraction.
-    
+
     Args:
         documents (list[dict]): List of documents containing 'chunks' field
-        
+
     Returns:
-        list[dict]: List of enriched chunk records ready for embedding
-        
+        Iterator[dict]: Lazily yielded enriched chunk records ready for embedding
+
     This function orchestrates the complete chunk enrichment pipeline:
-    1. Processes documents in parallel using multiprocessing for CPU-bound tasks
-    2. Enriches each chunk through text normalization, spell correction, stopword removal
+    1. Flattens all chunks across documents into individual work items
+    2. Enriches the chunks in parallel across a single ProcessPoolExecutor
     3. Extracts keywords from the combined processed text per document
-    4. Converts enriched documents into individual chunk records with metadata
-    
-    Uses ProcessPoolExecutor for document-level parallelization and ThreadPoolExecutor
-    for chunk-level processing within each document for optimal performance.
-    
+    4. Streams enriched documents out as individual chunk records with metadata
+
+    The unit of parallel work is a chunk, not a document: the enrichment is
+    pure-Python CPU-bound work, so a flat process pool load-balances well even
+    when chunk counts per document vary wildly, and avoids the GIL contention
+    a per-document thread pool would add.
+
+    Chunk records are yielded lazily via to_chunk_records so the enriched
+    chunk strings are not held twice (inside the documents and inside a
+    materialized record list) during the handoff to the embedder.
+
     Environment Variables Required:
         - KEYWORD_EXTRACTION_TOP_N: Number of top keywords to extract per document
     """
     logger.info(f"enrich_chunks() function started - processing {len(documents)} documents")
     logger.info(f"Enriching {len(documents)} documents")
-    
-    # Determine optimal number of workers
-    max_workers = min(len(documents), multiprocessing.cpu_count())
-    
-    # Process documents in parallel using ProcessPoolExecutor for CPU-bound tasks
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        enriched_docs = list(executor.map(process_single_document, documents))
-    
-    chunk_records = to_chunk_records(enriched_docs)
-    logger.info(f"Enriched {len(documents)} documents into {len(chunk_records)} chunks")
-    logger.info(f"enrich_chunks() function completed - created {len(chunk_records)} chunk records")
-    return chunk_records
+
+    # Flatten to (doc_idx, chunk_idx, chunk) tasks so the pool balances load
+    # at chunk granularity.
+    tasks = [
+        (doc_idx, chunk_idx, chunk)
+        for doc_idx, doc in enumerate(documents)
+        for chunk_idx, chunk in enumerate(doc["chunks"])
+    ]
+
+    word_counters = [Counter() for _ in documents]
+
+    if tasks:
+        max_workers = min(len(tasks), multiprocessing.cpu_count())
+        # Prefer forked workers: building the spell checker here first means
+        # every worker shares the parent's ~200k-entry frequency dict through
+        # copy-on-write pages instead of allocating its own copy, keeping RSS
+        # flat as the pool grows. Forking is only safe while this is the sole
+        # thread - forking a multi-threaded process (e.g. when called from a
+        # run_indexing_job stage thread) can deadlock on locks held by other
+        # threads and is deprecated on newer Pythons. With other threads
+        # live, an explicit forkserver (or spawn) context is used - the
+        # platform default would still be fork on Linux - and the
+        # initializer builds the dictionary once per worker instead.
+        if threading.active_count() == 1 and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+            _known_words(_get_spell())
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        # Batch tasks per IPC round-trip: without an explicit chunksize the
+        # pool pickles one task at a time, paying serialization overhead per
+        # chunk. Aim for ~4 batches per worker to keep load balance.
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        # The initializer builds the spell checker once per worker process so
+        # the dictionary is parsed P times rather than once per task.
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, initializer=_init_worker) as executor:
+            for doc_idx, chunk_idx, enriched, counts in executor.map(_enrich_one_chunk, tasks, chunksize=chunksize):
+                documents[doc_idx]["chunks"][chunk_idx] = enriched
+                word_counters[doc_idx].update(counts)
+
+    # Keywords come straight from the aggregated token counts: the workers
+    # already produced the filtered token stream, so there is no need to join
+    # and re-tokenize the enriched text. With a bounded n, most_common runs a
+    # heap-based top-N selection (O(V log n)) rather than a full vocabulary
+    # sort, so large documents don't pay O(V log V) here.
+    top_n = int(get_env_var("KEYWORD_EXTRACTION_TOP_N"))
+    for doc, word_counter in zip(documents, word_counters):
+        doc["keywords"] = [word for word, count in word_counter.most_common(top_n)]
+        if not doc["chunks"]:
+            logger.info(f"Document {doc['document_id']} has no chunks to process")
+
+    logger.info(f"enrich_chunks() function completed - enriched {len(documents)} documents")
+    return to_chunk_records(documents)
+
+
+def _enrich_one_chunk(task: tuple[int, int, str]) -> tuple[int, int, str, Counter]:
+    """
+    Pool worker: enriches one chunk and counts its tokens.
+
+    Args:
+        task (tuple[int, int, str]): (doc_idx, chunk_idx, raw chunk text)
+
+    Returns:
+        tuple[int, int, str, Counter]: (doc_idx, chunk_idx, enriched chunk
+            text, token frequency counts for the chunk)
+
+    The indices travel with the result so the parent process can scatter
+    enriched chunks back onto their documents regardless of completion order.
+    The token counts let the parent aggregate per-document keyword
+    frequencies without re-tokenizing the enriched text.
+    """
+    doc_idx, chunk_idx, chunk = task
+    tokens = _enrich_tokens(chunk, _get_spell())
+    return doc_idx, chunk_idx, " ".join(tokens), Counter(tokens)
 
 
 def process_single_document(doc: dict) -> dict:
     """
-    Process a single document with parallel chunk processing.
-    
+    Process a single document's chunks serially.
+
     Args:
         doc (dict): Document containing 'chunks' field and metadata
-        
+
     Returns:
         dict: Enriched document with processed chunks and extracted keywords
-        
+
     This function:
-    1. Creates a local spell checker instance for this process
-    2. Processes all chunks in parallel using ThreadPoolExecutor
-    3. Extracts keywords from the combined enriched text
+    1. Reuses the process-local spell checker
+    2. Enriches each chunk in sequence, accumulating token counts as it goes
+    3. Derives keywords from the accumulated counts without re-tokenizing
     4. Updates the document with enriched chunks and keywords
-    
-    Handles empty chunks gracefully and optimizes parallel processing
-    based on the number of chunks in the document.
+
+    The chunk work is CPU-bound pure Python, so there is no benefit to an
+    inner thread pool here; callers that want parallelism should go through
+    enrich_chunks, which fans chunks out across processes.
     """
     logger.info(f"process_single_document() function started - document: {doc.get('document_id', 'unknown')}")
-    # Create a local spell checker instance for this process
-    spell = SpellChecker()
-    
+    spell = _get_spell()
+
     logger.info(f"Enriching document {doc['document_id']}")
-    
+
     # Handle empty chunks case
     if not doc["chunks"]:
         doc["keywords"] = []
         logger.info(f"Document {doc['document_id']} has no chunks to process")
         logger.info(f"process_single_document() function completed - document: {doc.get('document_id', 'unknown')} (no chunks)")
         return doc
-    
-    # Process chunks in parallel using ThreadPoolExecutor (I/O bound within CPU-bound task)
-    max_chunk_workers = min(max(len(doc["chunks"]), 1), 4)  # Ensure at least 1, max 4
-    
-    with ThreadPoolExecutor(max_workers=max_chunk_workers) as executor:
-        # Create a partial function with the spell checker
-        process_func = partial(process_single_chunk, spell=spell)
-        enriched_chunks = list(executor.map(process_func, doc["chunks"]))
-    
+
+    word_counter = Counter()
+    enriched_chunks = []
+    for chunk in doc["chunks"]:
+        tokens = _enrich_tokens(chunk, spell)
+        enriched_chunks.append(" ".join(tokens))
+        word_counter.update(tokens)
+
+    top_n = int(get_env_var("KEYWORD_EXTRACTION_TOP_N"))
     doc["chunks"] = enriched_chunks
-    doc["keywords"] = extract_keywords(" ".join(enriched_chunks), spell)
+    doc["keywords"] = [word for word, count in word_counter.most_common(top_n)]
     logger.info(f"Enriched document {doc['document_id']}")
     logger.info(f"process_single_document() function completed - document: {doc.get('document_id', 'unknown')}")
-    
+
     return doc
 
 
@@ -112,23 +238,52 @@ def process_single_chunk(chunk: str, spell: SpellChecker) -> str:
     Returns:
         str: Enriched and cleaned text chunk
         
-    This function applies the following text preprocessing steps in sequence:
-    1. Basic text cleaning (lowercase, strip whitespace)
-    2. Unicode normalization and non-ASCII character removal
-    3. Punctuation removal
-    4. Spell correction using the provided spell checker
-    5. Stopword removal for noise reduction
-    
+    The enrichment is fused into a single pass instead of chaining the
+    standalone helpers, which would each re-copy and re-tokenize the text:
+    1. Unicode normalization, non-ASCII removal, and lowercasing in one step
+    2. A single regex tokenization that drops punctuation as a side effect
+    3. Stopword filtering and spell correction applied on the token stream
+
     The processed text is optimized for embedding generation and keyword extraction.
     """
-    logger.info(f"process_single_chunk() function started - chunk length: {len(chunk)} chars")
-    cleaned = clean_text(chunk)
-    normalized = normalize_unicode(cleaned)
-    no_punct = remove_punctuation(normalized)
-    no_typos = fix_spelling(no_punct, spell)
-    no_stops = remove_stopwords(no_typos)
-    logger.info(f"process_single_chunk() function completed - processed chunk length: {len(no_stops)} chars")
-    return no_stops
+    logger.debug("process_single_chunk() chunk length: %d chars", len(chunk))
+    return " ".join(_enrich_tokens(chunk, spell))
+
+
+def _enrich_tokens(chunk: str, spell: SpellChecker) -> list[str]:
+    """
+    Runs the fused enrichment pass and returns the final token list.
+
+    Args:
+        chunk (str): Raw text chunk to be processed
+        spell (SpellChecker): Spell checker instance for correction
+
+    Returns:
+        list[str]: Normalized, stopword-filtered, spell-corrected tokens
+
+    Returning tokens rather than joined text lets callers reuse the stream
+    directly — for example to count keyword frequencies — without having to
+    re-tokenize the enriched output.
+
+    Empty and trivially short chunks (splitter boundary artifacts, degenerate
+    content fields) short-circuit before the normalization and spell-check
+    work: they cannot produce a useful embedding anyway.
+    """
+    if not chunk or len(chunk.strip()) < 3:
+        return []
+    text = unicodedata.normalize('NFKD', chunk).encode('ascii', 'ignore').decode('ascii').lower()
+    tokens = [token for token in _WORD_RE.findall(text) if token not in _STOPWORDS]
+    known = _known_words(spell)
+    # Fast path: a single C-level set difference detects whether any token
+    # needs correction at all. Most chunks are fully in-dictionary, so they
+    # skip the per-token Python conditional below entirely.
+    unknown = set(tokens) - known
+    if not unknown:
+        return tokens
+    return [
+        token if token not in unknown else _correct_word(token, spell)
+        for token in tokens
+    ]
 
 
 def clean_text(text: str) -> str:
@@ -145,10 +300,7 @@ def clean_text(text: str) -> str:
     - Converts text to lowercase for consistency
     - Strips leading and trailing whitespace
     """
-    logger.info(f"clean_text() function started - text length: {len(text)} chars")
-    cleaned = text.lower().strip()
-    logger.info(f"clean_text() function completed - cleaned text length: {len(cleaned)} chars")
-    return cleaned
+    return text.lower().strip()
 
 def normalize_unicode(text: str) -> str:
     """
@@ -162,17 +314,16 @@ def normalize_unicode(text: str) -> str:
         
     This function:
     1. Applies NFKD Unicode normalization to decompose characters
-    2. Removes combining characters (accents, diacritics)
-    3. Filters out non-ASCII characters for consistency
-    4. Normalizes whitespace to single spaces
+    2. Drops combining characters and all other non-ASCII in one encode pass
+    3. Normalizes whitespace to single spaces and lowercases
+
+    The ASCII filtering is a single C-level encode with 'ignore' rather than
+    a character-by-character combining check plus a regex sub: NFKD combining
+    marks are non-ASCII by construction, so one pass covers both. Lowercasing
+    is folded in here too, making a separate clean_text call unnecessary.
     """
-    logger.info(f"normalize_unicode() function started - text length: {len(text)} chars")
-    text = unicodedata.normalize('NFKD', text)
-    text = ''.join(c for c in text if not unicodedata.combining(c))
-    text = re.sub(r'[^\x00-\x7F]+', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    logger.info(f"normalize_unicode() function completed - normalized text length: {len(text)} chars")
-    return text
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', text).strip().lower()
 
 def remove_punctuation(text: str) -> str:
     """
@@ -187,10 +338,7 @@ def remove_punctuation(text: str) -> str:
     Uses Python's string.punctuation set to identify and remove
     all standard punctuation marks, leaving only letters, digits, and spaces.
     """
-    logger.info(f"remove_punctuation() function started - text length: {len(text)} chars")
-    cleaned = text.translate(str.maketrans('', '', string.punctuation))
-    logger.info(f"remove_punctuation() function completed - text length: {len(cleaned)} chars")
-    return cleaned
+    return text.translate(_PUNCT_TABLE)
 
 
 def fix_spelling(text: str, spell: SpellChecker) -> str:
@@ -206,17 +354,18 @@ def fix_spelling(text: str, spell: SpellChecker) -> str:
         
     This function:
     1. Tokenizes the text into individual words
-    2. Checks each word against the spell checker dictionary
-    3. Applies corrections for misspelled words
-    4. Preserves correctly spelled words unchanged
-    5. Rejoins corrected words into cleaned text
+    2. Skips any word already present in the known-words set
+    3. Applies memoized corrections for the remaining misspelled words
+    4. Rejoins corrected words into cleaned text
+
+    The vast majority of tokens in real corpora are in-dictionary, so the
+    frozenset membership test short-circuits almost all correction work.
     """
-    logger.info(f"fix_spelling() function started - text length: {len(text)} chars")
-    tokens = word_tokenize(text)
-    corrected = [spell.correction(word) or word if word not in spell else word for word in tokens]
-    result = " ".join(corrected)
-    logger.info(f"fix_spelling() function completed - corrected text length: {len(result)} chars")
-    return result
+    logger.debug("fix_spelling() text length: %d chars", len(text))
+    known = _known_words(spell)
+    tokens = _TOKEN_RE.findall(text)
+    corrected = [word if word in known else _correct_word(word, spell) for word in tokens]
+    return " ".join(corrected)
 
 def remove_stopwords(text: str) -> str:
     """
@@ -238,22 +387,17 @@ def remove_stopwords(text: str) -> str:
     Stopword removal helps focus on important semantic content
     for embedding generation and keyword extraction.
     """
-    logger.info(f"remove_stopwords() function started - text length: {len(text)} chars")
-    stop_words = set(stopwords.words('english'))
-    words = word_tokenize(text)
-    filtered = [word for word in words if word.lower() not in stop_words]
-    result = " ".join(filtered)
-    logger.info(f"remove_stopwords() function completed - filtered text length: {len(result)} chars")
-    return result
-
-def extract_keywords(text: str, spell: SpellChecker) -> list[str]:
+    words = _TOKEN_RE.findall(text)
+    filtered = [word for word in words if word.lower() not in _STOPWORDS]
+    return " ".join(filtered)
+
+def extract_keywords(text: str) -> list[str]:
     """
     Extracts the most frequent keywords from processed text.
-    
+
     Args:
         text (str): Preprocessed text for keyword extraction
-        spell (SpellChecker): Spell checker instance (unused but kept for consistency)
-        
+
     Returns:
         list[str]: List of top keywords sorted by frequency
         
@@ -269,45 +413,47 @@ def extract_keywords(text: str, spell: SpellChecker) -> list[str]:
     Environment Variables Required:
         - KEYWORD_EXTRACTION_TOP_N: Number of top keywords to extract
     """
-    logger.info(f"extract_keywords() function started - text length: {len(text)} chars")
+    logger.debug("extract_keywords() text length: %d chars", len(text))
     top_n = int(get_env_var("KEYWORD_EXTRACTION_TOP_N"))
-    stop_words = set(stopwords.words('english'))
-    words = [w.lower() for w in word_tokenize(text) if w.isalpha() and w.lower() not in stop_words]
+    words = [w.lower() for w in _TOKEN_RE.findall(text) if w.lower() not in _STOPWORDS]
     freq = Counter(words)
-    keywords = [word for word, count in freq.most_common(top_n)]
-    logger.info(f"extract_keywords() function completed - extracted {len(keywords)} keywords")
-    return keywords
+    return [word for word, count in freq.most_common(top_n)]
 
-def to_chunk_records(documents: list[dict]) -> list[dict]:
+def to_chunk_records(documents: list[dict]) -> Iterator[dict]:
     """
     Converts enriched documents into individual chunk records for storage.
-    
+
     Args:
         documents (list[dict]): List of enriched documents with chunks and metadata
-        
-    Returns:
-        list[dict]: List of individual chunk records with complete metadata
-        
+
+    Yields:
+        dict: Individual chunk records with complete metadata
+
     This function:
     1. Iterates through all documents and their chunks
-    2. Creates a separate record for each chunk with:
+    2. Yields a separate record for each chunk with:
        - Unique chunk ID
        - Chunk index within the document
        - Original document metadata
        - Processed chunk text
        - Extracted keywords
     3. Preserves all document metadata for each chunk record
-    
-    The resulting chunk records are ready for embedding generation
-    and storage in the vector database.
+
+    Records are yielded lazily rather than materialized in a list, so the
+    consumer (typically the embedder) holds only the records it is currently
+    working on instead of a second full copy of every chunk.
+
+    Chunk IDs are deterministic UUIDs derived from the parent document ID and
+    chunk index: they avoid the per-chunk urandom syscall of uuid4, make a
+    chunk traceable back to its document position, and keep re-indexing the
+    same document idempotent in the vector store (Qdrant point IDs must be
+    UUIDs, so a plain "doc_id:index" string would not be accepted).
     """
-    logger.info(f"to_chunk_records() function started - processing {len(documents)} documents")
-    logger.info(f"Converting {len(documents)} documents to chunk records")
-    chunk_records = []
+    logger.debug("to_chunk_records() processing %d documents", len(documents))
     for doc in documents:
         for i, chunk_text in enumerate(doc["chunks"]):
-            chunk_record = {
-                 "chunk_id": str(uuid4()),                         # unique chunk id
+            yield {
+                "chunk_id": str(uuid5(NAMESPACE_URL, f"{doc['document_id']}:{i}")),  # deterministic chunk id
                 "chunk_index": i,
                 "chunk_text": chunk_text,
                 "doc_id": doc["document_id"],                     # parent doc reference
@@ -319,8 +465,4 @@ def to_chunk_records(documents: list[dict]) -> list[dict]:
                 "fetched_at": doc.get("fetched_at"),
                 "language": doc.get("language"),
                 "keywords": doc.get("keywords", []),
-            }
-            chunk_records.append(chunk_record)
-    logger.info(f"Converted {len(documents)} documents to {len(chunk_records)} chunk records")
-    logger.info(f"to_chunk_records() function completed - created {len(chunk_records)} chunk records")
-    return chunk_records
\ No newline at end of file
+            }
\ No newline at end of file
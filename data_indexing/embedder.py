@@ -1,13 +1,68 @@
 from FlagEmbedding import FlagModel
 import logging
+import sqlite3
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+import numpy as np
 from data_indexing import utils
-from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
 # Global model cache to avoid reloading
 _model_cache = {}
 
+# Optional on-disk embedding cache, opened lazily on first use
+_cache_conn = None
+
+
+def _get_embedding_cache() -> sqlite3.Connection | None:
+    """
+    Opens the on-disk embedding cache if one is configured.
+
+    Returns:
+        sqlite3.Connection | None: Cache connection, or None when the
+            EMBEDDING_CACHE_PATH environment variable is not set
+
+    The cache maps a blake2b hash of the chunk text to the raw embedding
+    bytes, so reruns over unchanged content skip the model entirely. The
+    connection is opened once per process and reused.
+    """
+    global _cache_conn
+    if _cache_conn is not None:
+        return _cache_conn
+    cache_path = utils.get_env_var("EMBEDDING_CACHE_PATH", default="")
+    if not cache_path:
+        return None
+    _cache_conn = sqlite3.connect(cache_path)
+    _cache_conn.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL, dtype TEXT NOT NULL)"
+    )
+    logger.info(f"Using embedding cache at {cache_path}")
+    return _cache_conn
+
+
+def _content_key(text: str) -> bytes:
+    """Returns the cache key for a chunk text (blake2b content hash)."""
+    return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _cache_lookup(cache: sqlite3.Connection, key: bytes):
+    """Returns the cached embedding for a key, or None on a cache miss."""
+    row = cache.execute("SELECT vector, dtype FROM embeddings WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    vector_bytes, dtype = row
+    return np.frombuffer(vector_bytes, dtype=dtype)
+
+
+def _cache_store(cache: sqlite3.Connection, key: bytes, embedding: np.ndarray):
+    """Writes one embedding into the cache (caller commits per batch)."""
+    cache.execute(
+        "INSERT OR REPLACE INTO embeddings (key, vector, dtype) VALUES (?, ?, ?)",
+        (key, embedding.tobytes(), str(embedding.dtype)),
+    )
+
 def load_embedder():
     """
     Loads and initializes the embedding model for text vectorization.
@@ -30,39 +85,129 @@ def load_embedder():
         logger.info(f"load_embedder() function completed - using cached model: {model_name}")
         return _model_cache[model_name]
     
-    # Load model and cache it
-    model = FlagModel(model_name)
+    # Load model and cache it. FP16 halves the model's memory bandwidth and
+    # roughly doubles encode throughput on GPUs with no retrieval-quality
+    # loss for these embedding models.
+    model = FlagModel(model_name, use_fp16=True)
     _model_cache[model_name] = model
     logger.info(f"load_embedder() function completed - loaded and cached model: {model_name}")
     return model
 
-def embed_chunks(chunk_records: list[dict]):
+def warm_up_embedder():
+    """
+    Loads the embedding model and runs one throwaway encode.
+
+    Model loading takes hundreds of milliseconds to seconds and the first
+    encode pays additional one-time costs (kernel compilation, memory
+    allocation). Calling this at server startup moves that latency out of
+    the first user query; the warmed model is the same cached instance
+    every later encode uses.
+    """
+    logger.info("warm_up_embedder() function started")
+    load_embedder().encode("warmup")
+    logger.info("warm_up_embedder() function completed - embedder ready")
+
+def embed_chunks(chunk_records: Iterable[dict]) -> list[dict]:
     """
     Generates vector embeddings for all text chunks in the provided records.
-    
+
     Args:
-        chunk_records (list[dict]): List of chunk records containing 'chunk_text' field
-        
+        chunk_records (Iterable[dict]): Chunk records containing 'chunk_text' field;
+            may be a list or a lazy generator (e.g., from enrich_chunks)
+
     Returns:
-        list[dict]: Updated chunk records with 'embedding' field added
-        
+        list[dict]: Chunk records with 'embedding' field added
+
     This function:
-    1. Loads the configured embedding model
-    2. Iterates through all chunk records with progress tracking
-    3. Generates vector embeddings for each chunk's text content
-    4. Adds embeddings as 'embedding' field in each record
-    
-    The embeddings are converted to list format for storage compatibility.
-    Progress is displayed using tqdm for long-running operations.
+    1. Consumes the records in windows of EMBED_BATCH_SIZE
+    2. Serves records whose content hash is already in the optional on-disk
+       cache without touching the model
+    3. Encodes the remaining texts in one batched call per window and writes
+       the new embeddings back to the cache
+
+    Texts are deduplicated by content hash before encoding: real corpora
+    repeat boilerplate (headers, footers, legal text) across chunks, and one
+    embedding is computed per distinct text and fanned out to every record
+    sharing it, both within a window and across the whole run.
+
+    Encoding is double-buffered: each window's encode call runs on a
+    single-worker thread pool while the next window's record consumption,
+    hashing, and cache lookups proceed on the main thread, so CPU-side
+    preparation overlaps with the model's (typically GPU-bound) encode
+    instead of serializing behind it.
+
+    The model itself is loaded lazily, so a rerun that hits the cache for
+    every chunk never pays the model load.
+
+    Consuming the input in bounded windows means a generator input is never
+    fully materialized before encoding starts, while batched encoding still
+    amortizes tokenization overhead and keeps the model's batches full.
+    Embeddings stay as numpy array rows all the way to the vector-store
+    write: converting to Python lists would box every float into its own
+    object, multiplying memory several-fold for no benefit.
+
+    Environment Variables Optional:
+        - EMBED_BATCH_SIZE: Number of texts encoded per model batch
+          (default 64)
+        - EMBEDDING_CACHE_PATH: Path to the sqlite embedding cache; caching
+          is disabled when unset
     """
-    logger.info(f"embed_chunks() function started - processing {len(chunk_records)} chunks")
-    model = load_embedder()
-    for chunk in tqdm(chunk_records, desc="Embedding chunks"):
-        text = chunk["chunk_text"]
-        embedding = model.encode(text)
-        chunk["embedding"] = embedding.tolist()
-    logger.info(f"embed_chunks() function completed - embedded {len(chunk_records)} chunks")
-    return chunk_records
+    logger.info("embed_chunks() function started")
+    batch_size = int(utils.get_env_var("EMBED_BATCH_SIZE", default="64"))
+    cache = _get_embedding_cache()
+    model = None
+    embedded_records = []
+    cache_hits = 0
+    # Embeddings already produced this run, keyed by content hash: duplicate
+    # texts share one embedding object instead of being re-encoded.
+    seen: dict[bytes, np.ndarray] = {}
+
+    def _drain(in_flight):
+        """Collects a finished encode, stores results, and emits the batch."""
+        batch, unique_pending, future = in_flight
+        if future is not None:
+            for (key, chunks), embedding in zip(unique_pending.items(), future.result()):
+                seen[key] = embedding
+                for chunk in chunks:
+                    chunk["embedding"] = embedding
+                if cache is not None:
+                    _cache_store(cache, key, embedding)
+            if cache is not None:
+                cache.commit()
+        embedded_records.extend(batch)
+
+    with ThreadPoolExecutor(max_workers=1) as encode_pool:
+        in_flight = None
+        for batch in utils.batched(chunk_records, batch_size):
+            # Group records still needing an embedding by content hash so each
+            # distinct text is encoded exactly once per window.
+            unique_pending: dict[bytes, list[dict]] = {}
+            for chunk in batch:
+                key = _content_key(chunk["chunk_text"])
+                embedding = seen.get(key)
+                if embedding is None and cache is not None:
+                    embedding = _cache_lookup(cache, key)
+                    if embedding is not None:
+                        seen[key] = embedding
+                        cache_hits += 1
+                if embedding is not None:
+                    chunk["embedding"] = embedding
+                else:
+                    unique_pending.setdefault(key, []).append(chunk)
+            future = None
+            if unique_pending:
+                if model is None:
+                    model = load_embedder()
+                texts = [chunks[0]["chunk_text"] for chunks in unique_pending.values()]
+                future = encode_pool.submit(model.encode, texts, batch_size=batch_size)
+            if in_flight is not None:
+                _drain(in_flight)
+            in_flight = (batch, unique_pending, future)
+        if in_flight is not None:
+            _drain(in_flight)
+
+    logger.info(f"embed_chunks() function completed - embedded {len(embedded_records)} chunks ({cache_hits} cache hits)")
+    return embedded_records
 
 
 
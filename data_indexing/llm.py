@@ -1,11 +1,171 @@
 
 
+import aiohttp
+import json
 import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from collections.abc import Iterator
+from functools import lru_cache
+from hashlib import sha256
 from data_indexing import utils
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared session with a keep-alive connection pool: a bare requests.post opens
+# a fresh TCP (and possibly TLS) connection per prompt, paying handshake
+# latency on every single LLM call. The adapter also retries transient
+# failures (connection errors and gateway/overload statuses) with
+# exponential backoff, so one network blip does not throw away the
+# retrieval and prompt-assembly work already done for the request.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("POST",),
+)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+
+
+class _CircuitBreaker:
+    """
+    Rejects LLM calls outright after a burst of consecutive failures.
+
+    Retries handle one-off blips; when the endpoint is down outright,
+    retrying every request multiplies the load on a struggling server and
+    makes every caller wait out the full retry schedule. After fail_max
+    consecutive failures the breaker opens and calls fail fast for
+    reset_timeout seconds, after which a single trial call is let through:
+    success closes the breaker, another failure re-opens it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raises RuntimeError while the breaker is open."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                raise RuntimeError("LLM circuit breaker open - request rejected")
+            # Half-open: let this call through as the trial; one more
+            # failure re-opens immediately.
+            self._opened_at = None
+            self._failures = self._fail_max - 1
+
+    def record_success(self):
+        """Closes the breaker and clears the failure streak."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """Counts a failure, opening the breaker once the streak hits fail_max."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._fail_max:
+                self._opened_at = time.monotonic()
+                logger.warning("LLM circuit breaker opened after %d consecutive failures", self._failures)
+
+
+_BREAKER = _CircuitBreaker()
+
+# (connect, read) timeouts: fail fast on connection problems while leaving
+# generous room for long generations.
+_TIMEOUT = (3, 120)
+
+# Response caches, enabled via LLM_CACHE_MODE=exact|semantic (default off).
+# RAG workloads repeat prompts often enough that a hit turns a multi-second
+# generation into a dictionary lookup.
+_EXACT_CACHE: OrderedDict = OrderedDict()
+_EXACT_CACHE_MAX = 1024
+_SEMANTIC_CACHE: list[tuple] = []  # (normalized prompt embedding, response)
+
+
+@lru_cache(maxsize=1)
+def _llm_config() -> tuple[str, str]:
+    """
+    Resolves and caches the (model name, inference URL) pair.
+
+    LLM_MODEL_NAME holds the name of the environment variable that carries
+    the actual model name, so a naive per-request resolution costs two env
+    lookups per call. The indirection is part of the configuration contract,
+    but the result never changes at runtime, so it is resolved exactly once.
+    """
+    model = utils.get_env_var(utils.get_env_var("LLM_MODEL_NAME"))
+    return model, utils.get_env_var("LLM_INFERENCE_URL")
+
+
+def _cache_mode() -> str:
+    """Returns the configured LLM cache mode: 'exact', 'semantic', or 'off'."""
+    return utils.get_env_var("LLM_CACHE_MODE", default="off").lower()
+
+
+def _exact_key(model: str, prompt: str) -> tuple[str, str]:
+    """Returns the exact-match cache key for a (model, prompt) pair."""
+    return model, sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _embed_prompt(prompt: str):
+    """Returns a unit-normalized embedding of the prompt for the semantic cache."""
+    # Imported lazily so the embedding model is only loaded when semantic
+    # caching is actually enabled.
+    from data_indexing.embedder import load_embedder
+    import numpy as np
+
+    embedding = np.asarray(load_embedder().encode(prompt), dtype="float32")
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else embedding
+
+
+def _lookup_cached_response(model: str, prompt: str):
+    """
+    Returns a cached response for the prompt, or None.
+
+    Exact mode matches on a hash of the full prompt; semantic mode embeds
+    the prompt and accepts the stored response whose cosine similarity
+    exceeds the LLM_CACHE_SIMILARITY threshold (default 0.97).
+    """
+    mode = _cache_mode()
+    if mode == "exact":
+        key = _exact_key(model, prompt)
+        response = _EXACT_CACHE.get(key)
+        if response is not None:
+            _EXACT_CACHE.move_to_end(key)
+        return response
+    if mode == "semantic" and _SEMANTIC_CACHE:
+        threshold = float(utils.get_env_var("LLM_CACHE_SIMILARITY", default="0.97"))
+        embedding = _embed_prompt(prompt)
+        best_score, best_response = max(
+            ((float(stored @ embedding), response) for stored, response in _SEMANTIC_CACHE),
+            key=lambda pair: pair[0],
+        )
+        if best_score >= threshold:
+            return best_response
+    return None
+
+
+def _store_cached_response(model: str, prompt: str, response: str):
+    """Stores a generated response under the configured cache mode."""
+    mode = _cache_mode()
+    if mode == "exact":
+        _EXACT_CACHE[_exact_key(model, prompt)] = response
+        if len(_EXACT_CACHE) > _EXACT_CACHE_MAX:
+            _EXACT_CACHE.popitem(last=False)
+    elif mode == "semantic":
+        _SEMANTIC_CACHE.append((_embed_prompt(prompt), response))
+
 def generate_llm_response(prompt: str, stream: bool = False):
     """
     Generate a response from the LLM using a generic LLM API.
@@ -30,12 +190,21 @@ def generate_llm_response(prompt: str, stream: bool = False):
     Raises:
         RuntimeError: If the API request fails or returns non-200 status code
     """
-    logger.info(f"generate_llm_response() function started - prompt length: {len(prompt)} chars")
-    model_env_var = utils.get_env_var("LLM_MODEL_NAME")
-    model = utils.get_env_var(model_env_var)
-    logger.info(f"Using model: {model}")
-    llm_url = utils.get_env_var("LLM_INFERENCE_URL")
-    stream_mode = bool(utils.get_env_var("LLM_STREAM_MODE"))
+    logger.debug("generate_llm_response() started - prompt_len=%d", len(prompt))
+    if stream:
+        # Collect the streamed tokens; callers that want them incrementally
+        # should iterate stream_llm_response directly.
+        result = "".join(stream_llm_response(prompt))
+        logger.debug("generate_llm_response() completed via stream")
+        return result
+
+    model, llm_url = _llm_config()
+    logger.debug("Using model: %s", model)
+
+    cached = _lookup_cached_response(model, prompt)
+    if cached is not None:
+        logger.debug("generate_llm_response() completed - cache hit")
+        return cached
 
     payload = {
         "model": model,
@@ -43,11 +212,130 @@ def generate_llm_response(prompt: str, stream: bool = False):
         "stream": stream,
     }
 
-    response = requests.post(llm_url, json=payload)
+    _BREAKER.before_call()
+    try:
+        response = _SESSION.post(llm_url, json=payload, timeout=_TIMEOUT)
+    except requests.RequestException:
+        _BREAKER.record_failure()
+        raise
 
     if response.status_code != 200:
+        _BREAKER.record_failure()
         logger.error(f"generate_llm_response() function failed - API error: {response.status_code}")
         raise RuntimeError(f"OllamaAPI error: {response.status_code}{response.text}")
+    _BREAKER.record_success()
+
+    result = response.json()["response"]
+    _store_cached_response(model, prompt, result)
+    logger.debug("generate_llm_response() completed - response generated")
+    return result
+
+
+def stream_llm_response(prompt: str) -> Iterator[str]:
+    """
+    Generate a response from the LLM, yielding tokens as they arrive.
+
+    Args:
+        prompt (str): The prompt to generate a response for
+
+    Yields:
+        str: The next fragment of generated text
+
+    Buffering the full generation means time-to-first-token equals
+    time-to-last-token; streaming lets callers start displaying or
+    post-processing output immediately and avoids holding the whole
+    completion in memory. The response is consumed as JSON lines (the
+    native Ollama streaming format), yielding each fragment until the
+    server marks the generation done.
+
+    Raises:
+        RuntimeError: If the API request fails or returns non-200 status code
+    """
+    logger.debug("stream_llm_response() started - prompt_len=%d", len(prompt))
+    model, llm_url = _llm_config()
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+    }
+
+    _BREAKER.before_call()
+    try:
+        response = _SESSION.post(llm_url, json=payload, timeout=_TIMEOUT, stream=True)
+    except requests.RequestException:
+        _BREAKER.record_failure()
+        raise
+
+    if response.status_code != 200:
+        _BREAKER.record_failure()
+        logger.error(f"stream_llm_response() function failed - API error: {response.status_code}")
+        raise RuntimeError(f"OllamaAPI error: {response.status_code}{response.text}")
+    _BREAKER.record_success()
+
+    for line in response.iter_lines():
+        if not line:
+            continue
+        fragment = json.loads(line)
+        yield fragment.get("response", "")
+        if fragment.get("done"):
+            break
+    logger.debug("stream_llm_response() completed - response streamed")
+
+
+async def generate_llm_response_async(prompt: str, session: aiohttp.ClientSession, stream: bool = False):
+    """
+    Generate a response from the LLM without blocking the event loop.
+
+    Args:
+        prompt (str): The prompt to generate a response for
+        session (aiohttp.ClientSession): Shared client session for connection reuse
+        stream (bool, optional): Whether to stream the response. Defaults to False.
+
+    Returns:
+        str: Generated response text from the LLM
+
+    Async counterpart of generate_llm_response: the synchronous version
+    blocks its thread for the full generation time, so a server handling
+    concurrent RAG queries would serialize every LLM call. Awaiting the POST
+    lets many in-flight prompts overlap on one event loop, which scales
+    near-linearly with concurrency for a remote (I/O-bound) endpoint.
+
+    The caller owns the session so one connection pool is shared across all
+    requests rather than rebuilt per call.
+
+    Raises:
+        RuntimeError: If the API request fails or returns non-200 status code
+    """
+    logger.debug("generate_llm_response_async() started - prompt_len=%d", len(prompt))
+    model, llm_url = _llm_config()
+
+    cached = _lookup_cached_response(model, prompt)
+    if cached is not None:
+        logger.debug("generate_llm_response_async() completed - cache hit")
+        return cached
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+    }
+
+    _BREAKER.before_call()
+    try:
+        async with session.post(llm_url, json=payload) as response:
+            if response.status != 200:
+                _BREAKER.record_failure()
+                body = await response.text()
+                logger.error(f"generate_llm_response_async() function failed - API error: {response.status}")
+                raise RuntimeError(f"OllamaAPI error: {response.status}{body}")
+            data = await response.json()
+    except aiohttp.ClientError:
+        _BREAKER.record_failure()
+        raise
+    _BREAKER.record_success()
 
-    logger.info("generate_llm_response() function completed - response generated")
-    return response.json()["response"]
\ No newline at end of file
+    result = data["response"]
+    _store_cached_response(model, prompt, result)
+    logger.debug("generate_llm_response_async() completed - response generated")
+    return result
\ No newline at end of file
@@ -2,11 +2,35 @@
 
 from data_indexing.utils import get_env_var
 from pymongo import MongoClient
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Collections at or below this size are read through a single cursor; the
+# partitioning pre-pass is not worth it for small collections.
+_PARALLEL_LOAD_MIN_DOCS = 10_000
+
+@lru_cache(maxsize=1)
+def _mongo_projection():
+    """
+    Returns the find() projection derived from MONGO_FIELDS, or None.
+
+    MONGO_FIELDS is a comma-separated whitelist of the document fields the
+    pipeline actually uses (e.g. "text,source,location,doc_id,created_at").
+    Without a projection the server ships every field of every document,
+    so collections carrying large unused blobs pay their full network and
+    BSON-decode cost on each indexing run. When MONGO_FIELDS is unset all
+    fields are fetched, preserving the previous behavior.
+    """
+    fields = get_env_var("MONGO_FIELDS", default="")
+    if not fields:
+        return None
+    return {field.strip(): 1 for field in fields.split(",") if field.strip()}
+
 def get_document_content() -> list[dict]:
     """
     Retrieves all documents from the configured MongoDB collection.
@@ -36,12 +60,53 @@ def get_document_content() -> list[dict]:
     db_name = get_env_var("MONGO_DB_NAME")
     collection_name = get_env_var("MONGO_COLLECTION_NAME")
 
-    documents = load_documents(client, db_name, collection_name)
+    documents = load_documents(client, db_name, collection_name, projection=_mongo_projection())
 
     logger.info(f"get_document_content() function completed - retrieved {len(documents)} documents")
     return documents
 
-def load_documents(client: MongoClient, db_name: str, collection_name: str):
+def stream_documents():
+    """
+    Yields documents from the configured MongoDB collection one at a time.
+
+    Yields:
+        dict: The next document from the collection
+
+    Streaming counterpart of get_document_content: instead of materializing
+    the whole collection into one list, documents flow out of a server-side
+    cursor in batches of 1000 as the caller consumes them. This keeps peak
+    memory bounded by the cursor batch and lets downstream pipeline stages
+    (chunking, embedding) start working while MongoDB is still reading. The
+    MONGO_FIELDS projection is applied the same way as in the list-based
+    loader.
+
+    Environment Variables Required:
+        - MONGO_DB_NAME: Name of the MongoDB database
+        - MONGO_COLLECTION_NAME: Name of the collection containing documents
+        - MONGO_URI: MongoDB connection URI
+        - MONGO_PORT: MongoDB connection port
+
+    Raises:
+        ValueError: If database or collection doesn't exist
+    """
+    logger.info("stream_documents() function started")
+    client = get_mongo_client()
+    db_name = get_env_var("MONGO_DB_NAME")
+    collection_name = get_env_var("MONGO_COLLECTION_NAME")
+
+    if not is_database_exists(client, db_name):
+        logger.error(f"Database {db_name} does not exist")
+        raise ValueError(f"Database {db_name} does not exist")
+    if not is_collection_exists(client, db_name, collection_name):
+        logger.error(f"Collection {collection_name} does not exist")
+        raise ValueError(f"Collection {collection_name} does not exist")
+
+    collection = client[db_name][collection_name]
+    yield from collection.find({}, _mongo_projection(), batch_size=1000)
+    logger.info("stream_documents() function completed")
+
+def load_documents(client: MongoClient, db_name: str, collection_name: str,
+                   projection: dict | None = None):
     """
     Loads all documents from a specific MongoDB collection.
     
@@ -49,6 +114,8 @@ def load_documents(client: MongoClient, db_name: str, collection_name: str):
         client (MongoClient): Connected MongoDB client instance
         db_name (str): Name of the database to access
         collection_name (str): Name of the collection to load from
+        projection (dict | None, optional): Field whitelist forwarded to
+            find(); None fetches all fields
         
     Returns:
         list[dict]: List of documents from the collection
@@ -63,7 +130,6 @@ def load_documents(client: MongoClient, db_name: str, collection_name: str):
         ValueError: If database or collection doesn't exist
     """
     logger.info(f"load_documents() function started - loading from {db_name}.{collection_name}")
-    logger.info(f"Loading documents from {db_name}.{collection_name}...")
     if not is_database_exists(client, db_name):
         logger.error(f"Database {db_name} does not exist")
         raise ValueError(f"Database {db_name} does not exist")
@@ -76,11 +142,98 @@ def load_documents(client: MongoClient, db_name: str, collection_name: str):
 
     collection = db[collection_name]
 
-    documents = list(collection.find())
-    logger.info(f"Documents loaded, {len(documents)} documents")
+    documents = load_documents_parallel(client, db_name, collection_name, projection=projection)
     logger.info(f"load_documents() function completed - loaded {len(documents)} documents")
     return documents
 
+def _create_batches(collection, chunk_size: int) -> list[tuple]:
+    """
+    Splits a collection into _id ranges of roughly chunk_size documents.
+
+    Args:
+        collection: MongoDB collection to partition
+        chunk_size (int): Target number of documents per range
+
+    Returns:
+        list[tuple]: (low, high) _id boundary pairs; the last range has
+            high=None, meaning "to the end of the collection"
+
+    Only the _id field is fetched during this pre-pass, so the boundary
+    scan is cheap (index-only) even on collections with large documents.
+    Ranges on _id are preferred over skip/limit because skip forces the
+    server to walk and discard all preceding documents for every batch.
+    islice steps over the cursor keeping every chunk_size-th id, so the
+    pre-pass holds O(N / chunk_size) boundaries rather than materializing
+    all N ids - this path only runs on large collections, exactly where a
+    full id list would hurt.
+    """
+    id_cursor = collection.find({}, {"_id": 1}).sort("_id", 1).batch_size(chunk_size)
+    boundaries = [doc["_id"] for doc in islice(id_cursor, None, None, chunk_size)]
+    return [
+        (low, boundaries[i + 1] if i + 1 < len(boundaries) else None)
+        for i, low in enumerate(boundaries)
+    ]
+
+def _get_cursor(collection, low, high, projection: dict | None = None):
+    """
+    Returns a cursor over the documents whose _id falls in [low, high).
+
+    Args:
+        collection: MongoDB collection to read from
+        low: Inclusive lower _id boundary
+        high: Exclusive upper _id boundary, or None for the final range
+        projection (dict | None, optional): Field whitelist forwarded to find()
+    """
+    id_filter = {"$gte": low}
+    if high is not None:
+        id_filter["$lt"] = high
+    return collection.find({"_id": id_filter}, projection)
+
+def load_documents_parallel(client: MongoClient, db_name: str, collection_name: str,
+                            workers: int = 8, chunk_size: int = 5000,
+                            projection: dict | None = None) -> list[dict]:
+    """
+    Loads all documents from a collection using concurrent range reads.
+
+    Args:
+        client (MongoClient): Connected MongoDB client instance
+        db_name (str): Name of the database to access
+        collection_name (str): Name of the collection to load from
+        workers (int, optional): Number of concurrent reader threads. Defaults to 8.
+        chunk_size (int, optional): Documents per _id range. Defaults to 5000.
+        projection (dict | None, optional): Field whitelist forwarded to
+            find(); None fetches all fields
+
+    Returns:
+        list[dict]: List of documents from the collection
+
+    A single find() cursor pulls the whole collection sequentially, so load
+    time is bound by one connection's round-trip latency. This function
+    partitions the collection into _id ranges and fetches the ranges
+    concurrently from a thread pool; the work is I/O-bound, so threads give
+    near-linear speedup with worker count on large collections. Small
+    collections fall back to a plain single-cursor read, skipping the
+    boundary pre-pass.
+
+    Results are concatenated in _id-range order, so the output ordering
+    matches the single-cursor natural order on _id.
+    """
+    logger.info(f"load_documents_parallel() function started - loading from {db_name}.{collection_name}")
+    collection = client[db_name][collection_name]
+
+    if collection.estimated_document_count() <= _PARALLEL_LOAD_MIN_DOCS:
+        documents = list(collection.find({}, projection))
+        logger.info(f"load_documents_parallel() function completed - loaded {len(documents)} documents (single cursor)")
+        return documents
+
+    batches = _create_batches(collection, chunk_size)
+    documents = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for partition in pool.map(lambda bounds: list(_get_cursor(collection, *bounds, projection=projection)), batches):
+            documents.extend(partition)
+    logger.info(f"load_documents_parallel() function completed - loaded {len(documents)} documents from {len(batches)} ranges")
+    return documents
+
 def is_database_exists(client: MongoClient, db_name: str) -> bool:
     """
     Checks if a database exists in the MongoDB instance.
@@ -95,9 +248,9 @@ def is_database_exists(client: MongoClient, db_name: str) -> bool:
     This function queries the MongoDB instance for available databases
     and checks if the specified database name is present in the list.
     """
-    logger.info(f"is_database_exists() function started - checking database: {db_name}")
+    logger.debug("is_database_exists() checking database: %s", db_name)
     exists = db_name in client.list_database_names()
-    logger.info(f"is_database_exists() function completed - database '{db_name}' exists: {exists}")
+    logger.debug("is_database_exists() - database '%s' exists: %s", db_name, exists)
     return exists
 
 def is_collection_exists(client: MongoClient, db_name: str, collection_name: str) -> bool:
@@ -115,9 +268,9 @@ def is_collection_exists(client: MongoClient, db_name: str, collection_name: str
     This function queries the specified database for available collections
     and checks if the given collection name is present.
     """
-    logger.info(f"is_collection_exists() function started - checking {db_name}.{collection_name}")
+    logger.debug("is_collection_exists() checking %s.%s", db_name, collection_name)
     exists = collection_name in client[db_name].list_collection_names()
-    logger.info(f"is_collection_exists() function completed - collection '{collection_name}' exists: {exists}")
+    logger.debug("is_collection_exists() - collection '%s' exists: %s", collection_name, exists)
     return exists
 
 def get_mongo_client():
@@ -1,15 +1,100 @@
 # data_indexing/pipeline.py
 
-from data_indexing.mongo_loader import get_document_content
+from data_indexing.mongo_loader import stream_documents
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from data_indexing.chunker import chunk_text
 from data_indexing.chunk_enricher import enrich_chunks
 from data_indexing.embedder import embed_chunks
 from data_indexing import utils
-from data_indexing.storage import upsert_chunks
+from data_indexing.storage import create_collection_if_not_exists, finalize_bulk_upsert, upsert_chunks
 
 logger = logging.getLogger(__name__)
 
+# Depth of the inter-stage queues. A small bound provides backpressure: a
+# fast Mongo reader cannot run arbitrarily far ahead of a slow embedder, so
+# at most a few windows of work are in memory at once.
+_QUEUE_DEPTH = 4
+
+# Sentinel signalling the end of a stage's output stream.
+_STOP = object()
+
+
+def _drain(stage_queue: queue.Queue):
+    """Discards queued items until the stop sentinel, unblocking upstream."""
+    while stage_queue.get() is not _STOP:
+        pass
+
+
+def _produce_documents(raw_queue: queue.Queue, batch_size: int) -> int:
+    """
+    Reads document windows from MongoDB into the raw-document queue.
+
+    Args:
+        raw_queue (queue.Queue): Destination queue for document windows
+        batch_size (int): Number of documents per window
+
+    Returns:
+        int: Total number of documents read
+    """
+    total_documents = 0
+    try:
+        for document_batch in utils.batched(stream_documents(), batch_size):
+            total_documents += len(document_batch)
+            logger.info(f"Loaded window of {len(document_batch)} documents ({total_documents} so far)")
+            raw_queue.put(document_batch)
+    finally:
+        raw_queue.put(_STOP)
+    return total_documents
+
+
+def _chunk_and_enrich(raw_queue: queue.Queue, chunk_queue: queue.Queue):
+    """
+    Chunks and enriches document windows from the raw queue.
+
+    Args:
+        raw_queue (queue.Queue): Source queue of document windows
+        chunk_queue (queue.Queue): Destination queue for enriched chunk records
+
+    On failure the raw queue is drained so the producer never blocks on a
+    full queue with no consumer left.
+    """
+    try:
+        while (document_batch := raw_queue.get()) is not _STOP:
+            chunk_queue.put(list(enrich_chunks(chunk_text(document_batch))))
+    except BaseException:
+        _drain(raw_queue)
+        raise
+    finally:
+        chunk_queue.put(_STOP)
+
+
+def _embed_and_upsert(chunk_queue: queue.Queue) -> int:
+    """
+    Embeds and upserts enriched chunk windows from the chunk queue.
+
+    Args:
+        chunk_queue (queue.Queue): Source queue of enriched chunk records
+
+    Returns:
+        int: Total number of chunks written to the vector store
+
+    On failure the chunk queue is drained so the enricher never blocks on a
+    full queue with no consumer left.
+    """
+    total_chunks = 0
+    try:
+        while (chunk_records := chunk_queue.get()) is not _STOP:
+            embedded = embed_chunks(chunk_records)
+            upsert_chunks(embedded)
+            total_chunks += len(embedded)
+            logger.info(f"Saved {len(embedded)} chunks ({total_chunks} total)")
+    except BaseException:
+        _drain(chunk_queue)
+        raise
+    return total_chunks
+
 
 def run_indexing_job():
     """
@@ -22,36 +107,57 @@ def run_indexing_job():
     4. Generates vector embeddings for each chunk using the configured model
     5. Stores enriched chunks with embeddings in the vector database
     
-    The pipeline processes documents in sequence with progress logging
-    at each step. Uses environment variables for configuration of chunk
-    sizes, embedding models, and database connections.
-    
+    The stages run as a three-thread producer/consumer pipeline connected by
+    bounded queues: one thread streams document windows of
+    INDEX_DOC_BATCH_SIZE documents (default 256) out of MongoDB, one chunks
+    and enriches them, and one embeds and upserts the results. Running the
+    stages concurrently means the Mongo read of the next window overlaps
+    chunking and embedding of the previous ones, so throughput approaches
+    the slowest stage's rate rather than the sum of all stage times. The
+    small queue bound provides backpressure, keeping peak memory constant
+    regardless of collection size. Uses environment variables for
+    configuration of chunk sizes, embedding models, and database
+    connections.
+
     Raises:
         Exception: If any step in the pipeline fails, propagates the error
     """
     logger.info("Starting data indexing job...")
+    batch_size = int(utils.get_env_var("INDEX_DOC_BATCH_SIZE", default="256"))
+    collection_name = utils.get_env_var("VECTOR_DB_COLLECTION_NAME")
+    logger.info(f"Indexing into {collection_name} with document windows of {batch_size}")
 
-    logger.info("Loading documents from MongoDB...")
-    documents  = get_document_content()
-    logger.info(f"Loaded {len(documents)} documents")
-
-    logger.info("Chunking documents...")
-    documents = chunk_text(documents)
-    logger.info(f"Chunked {len(documents)} documents")
+    # Verify/create the collection up front: the storage module caches the
+    # result, so none of the per-window upserts pay the existence probe.
+    # bulk_mode defers HNSW indexing until finalize_bulk_upsert below, so
+    # the server is not rebuilding the index concurrently with every write.
+    create_collection_if_not_exists(bulk_mode=True)
 
-    logger.info("Enriching chunks...")
-    chunk_records = enrich_chunks(documents)
-    logger.info(f"Enriched {len(chunk_records)} chunks")
+    raw_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+    chunk_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_DEPTH)
 
-    logger.info("Embedding chunks...")
-    chunk_records = embed_chunks(chunk_records)
-    logger.info(f"Embedded {len(chunk_records)} chunks")
+    # finalize runs in a finally block: if a stage fails mid-run the
+    # collection must not be left with indexing disabled, or every search
+    # against it degrades to a full scan until someone repairs it by hand.
+    # It is best-effort - an exception raised in a finally block would
+    # replace the stage failure that is propagating, so a dead Qdrant must
+    # not turn "producer crashed" into "finalize crashed" in the logs.
+    try:
+        with ThreadPoolExecutor(max_workers=3) as stages:
+            producer = stages.submit(_produce_documents, raw_queue, batch_size)
+            enricher = stages.submit(_chunk_and_enrich, raw_queue, chunk_queue)
+            writer = stages.submit(_embed_and_upsert, chunk_queue)
 
-    logger.info(f"Saving chunks to {utils.get_env_var('VECTOR_DB_COLLECTION_NAME')}...")
-    upsert_chunks(chunk_records)
-    logger.info(f"Saved {len(chunk_records)} chunks")
+            total_chunks = writer.result()
+            enricher.result()
+            total_documents = producer.result()
+    finally:
+        try:
+            finalize_bulk_upsert()
+        except Exception:
+            logger.exception("finalize_bulk_upsert() failed - indexing may still be disabled on the collection")
 
-    logger.info("Indexing job completed successfully")
+    logger.info(f"Indexing job completed successfully - {total_documents} documents, {total_chunks} chunks")
 
 
 
@@ -1,9 +1,32 @@
 from data_indexing import utils
 from qdrant_client.models import ScoredPoint
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Metadata fields rendered ahead of each chunk, as (label, payload key)
+# pairs. Built once at module level so the per-chunk loop iterates a
+# constant instead of re-creating the field list per request.
+FIELDS = [
+    ("Location", "location"),
+    ("Source", "source"),
+    ("Document ID", "doc_id"),
+    ("Created At", "created_at"),
+]
+
+@lru_cache(maxsize=1)
+def _get_template() -> str:
+    """
+    Resolves and caches the prompt template string.
+
+    PROMPT_TYPE names the environment variable that holds the actual
+    template, so a naive per-query resolution costs two env lookups. The
+    template never changes at runtime, so it is resolved exactly once.
+    """
+    return utils.get_env_var(utils.get_env_var("PROMPT_TYPE"))
+
+
 def build_prompt_context(query: str, relevant_chunks: list[ScoredPoint]):
     """
     Builds a contextual prompt by combining user query with relevant document chunks.
@@ -31,38 +54,49 @@ def build_prompt_context(query: str, relevant_chunks: list[ScoredPoint]):
         - MAX_CONTEXT_CHARS: Maximum characters allowed in context
         - PROMPT_TYPE: Template type for prompt formatting
     """
-    logger.info(f"build_prompt_context() function started - query: {query[:50]}..., chunks: {len(relevant_chunks)}")
+    logger.debug("build_prompt_context() started - chunks=%d", len(relevant_chunks))
     include_metadata = bool(utils.get_env_var("INCLUDE_METADATA"))
     max_context_chars = int(utils.get_env_var("MAX_CONTEXT_CHARS"))
     max_each_chunk_chars = int(utils.get_env_var("MAX_EACH_CHUNK_CHARS"))
-    context = ""
+    # Snippets are collected in a list and joined once: building the context
+    # with repeated string concatenation re-copies the accumulated prefix on
+    # every iteration, which is quadratic in total context length. An integer
+    # counter tracks the running length for the budget check.
+    parts = []
+    total = 0
     for chunk in relevant_chunks:
-        payload = chunk.payload
-        text = payload.get("chunk_text", "") if payload else ""
+        # Normalizing a missing payload to {} once removes the per-field
+        # truthiness test, and keeping the fetched value halves the dict
+        # lookups: one .get per field instead of a check plus a re-fetch.
+        payload = chunk.payload or {}
+        text = payload.get("chunk_text", "")
         if max_each_chunk_chars != -1 and len(text) > max_each_chunk_chars:
             text = text[:max_each_chunk_chars] + "..."
+        # The text alone is a lower bound on the snippet length, so when it
+        # already blows the remaining budget the metadata f-strings below
+        # would be formatted only to be thrown away.
+        if max_context_chars != -1 and total + len(text) > max_context_chars:
+            break
         if include_metadata:
             meta = []
-            if payload and payload.get("location"):
-                meta.append(f"Location: {payload['location']}")
-            if payload and payload.get("source"):
-                meta.append(f"Source: {payload['source']}")
-            if payload and payload.get("doc_id"):
-                meta.append(f"Document ID: {payload['doc_id']}")
-            if payload and payload.get("created_at"):
-                meta.append(f"Created At: {payload['created_at']}")
+            for label, key in FIELDS:
+                value = payload.get(key)
+                if value:
+                    meta.append(f"{label}: {value}")
             snippet = (", ".join(meta) + "\n" if meta else "") + text
         else:
             snippet = text + "\n"
-   
-        if max_context_chars != -1 and len(context) + len(snippet) > max_context_chars:
+
+        if max_context_chars != -1 and total + len(snippet) > max_context_chars:
             break
-        context += snippet
+        parts.append(snippet)
+        total += len(snippet)
+    context = "".join(parts)
     prompt = render_prompt(
         context=context,
         query=query,
     )
-    logger.info(f"build_prompt_context() function completed - prompt length: {len(prompt)} chars")
+    logger.debug("build_prompt_context() completed - prompt_len=%d", len(prompt))
     return prompt
 
 
@@ -92,9 +126,7 @@ def render_prompt(context: str, query: str, **kwargs):
         - PROMPT_TYPE: Key identifying which prompt template to use
         - {PROMPT_TYPE}: Template string with placeholders for context and query
     """
-    logger.info(f"render_prompt() function started - context length: {len(context)}, query length: {len(query)}")
-    prompt_type = utils.get_env_var("PROMPT_TYPE")
-    template = utils.get_env_var(prompt_type)
-    rendered_prompt = template.format(context=context, query=query, **kwargs)
-    logger.info(f"render_prompt() function completed - final prompt length: {len(rendered_prompt)} chars")
+    logger.debug("render_prompt() started - context_len=%d query_len=%d", len(context), len(query))
+    rendered_prompt = _get_template().format(context=context, query=query, **kwargs)
+    logger.debug("render_prompt() completed - prompt_len=%d", len(rendered_prompt))
     return rendered_prompt
\ No newline at end of file
@@ -1,16 +1,25 @@
-from data_indexing.retriver import retrive_relevant_chunks
-from data_indexing.llm import generate_llm_response
+from data_indexing.retriver import retrive_relevant_chunks, QueryBatcher
+from data_indexing.llm import generate_llm_response, generate_llm_response_async
 from data_indexing.prompt_assembler import build_prompt_context
+import aiohttp
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
-def anser_query(query: str):
+# Shared micro-batcher for the async path: concurrent queries that arrive
+# within its flush window share one embed call and one Qdrant search_batch.
+_query_batcher = QueryBatcher()
+
+def anser_query(query: str, client=None):
     """
     Processes a user query through the RAG (Retrieval-Augmented Generation) pipeline.
     
     Args:
         query (str): The user's question or query to be answered
+        client (QdrantClient | None, optional): Vector-store client for the
+            retrieval step; defaults to the retriever's shared persistent
+            gRPC channel
         
     Returns:
         str: Generated response from the LLM based on retrieved relevant context
@@ -24,8 +33,65 @@ def anser_query(query: str):
     and LLM generation (model name, inference URL, context limits).
     """
     logger.info(f"anser_query() function started - processing query: {query[:100]}...")
-    relevant_chunks = retrive_relevant_chunks(query)
+    relevant_chunks = retrive_relevant_chunks(query, client=client)
     prompt = build_prompt_context(query, relevant_chunks)
     response = generate_llm_response(prompt)
     logger.info("anser_query() function completed - response generated")
-    return response
\ No newline at end of file
+    return response
+
+
+async def anser_query_async(query: str, session: aiohttp.ClientSession):
+    """
+    Processes a user query through the RAG pipeline without blocking the event loop.
+
+    Args:
+        query (str): The user's question or query to be answered
+        session (aiohttp.ClientSession): Shared client session for the LLM call
+
+    Returns:
+        str: Generated response from the LLM based on retrieved relevant context
+
+    Async counterpart of anser_query: retrieval goes through the shared
+    query batcher so concurrent queries share one embed+search round trip,
+    prompt assembly runs inline (fast relative to generation), and the LLM
+    call is awaited so other in-flight queries can progress during
+    generation.
+    """
+    logger.info(f"anser_query_async() function started - processing query: {query[:100]}...")
+    relevant_chunks = await _query_batcher.retrieve(query)
+    prompt = build_prompt_context(query, relevant_chunks)
+    response = await generate_llm_response_async(prompt, session)
+    logger.info("anser_query_async() function completed - response generated")
+    return response
+
+
+async def answer_queries(queries: list[str], max_concurrency: int = 8) -> list[str]:
+    """
+    Answers a batch of queries concurrently through the RAG pipeline.
+
+    Args:
+        queries (list[str]): Queries to answer
+        max_concurrency (int, optional): Maximum number of queries in flight
+            at once. Defaults to 8.
+
+    Returns:
+        list[str]: Responses in the same order as the input queries
+
+    One aiohttp session (and therefore one connection pool) is shared by
+    every query, and a semaphore caps the number of concurrent LLM calls so
+    a large batch does not overwhelm the inference endpoint. Since LLM
+    generation dominates query latency and is I/O-bound from this process's
+    perspective, throughput scales roughly with the concurrency limit.
+    """
+    logger.info(f"answer_queries() function started - {len(queries)} queries, max concurrency {max_concurrency}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def answer_one(query: str) -> str:
+            async with semaphore:
+                return await anser_query_async(query, session)
+
+        responses = await asyncio.gather(*(answer_one(query) for query in queries))
+    logger.info(f"answer_queries() function completed - {len(responses)} responses generated")
+    return list(responses)
\ No newline at end of file
@@ -1,17 +1,135 @@
-from qdrant_client import QdrantClient, models
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from data_indexing import utils
+import asyncio
 import logging
+import os
+import threading
+import weakref
+import numpy as np
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
+
+def _as_vector(embedding) -> np.ndarray:
+    """
+    Coerces an embedding to a contiguous float32 numpy array.
+
+    Over gRPC the client encodes such an array straight from its C buffer
+    into packed protobuf floats; a Python list (or a float64/strided array)
+    instead boxes every float into its own object on the way through. The
+    call is a no-op view when the embedder already produced contiguous
+    float32, which is the common case.
+    """
+    return np.ascontiguousarray(embedding, dtype=np.float32)
+
 collection_name = utils.get_env_var("VECTOR_DB_COLLECTION_NAME")
 VECTOR_DB_EMBEDDING_SIZE = int(utils.get_env_var("VECTOR_DB_EMBEDDING_SIZE"))
 url = utils.get_env_var("VECTOR_DB_URL")
 
-def create_collection_if_not_exists() -> QdrantClient:
+# Module-level client cache: constructing a QdrantClient opens a fresh HTTP
+# connection pool (plus DNS resolution), which is pure overhead when repeated
+# on every upsert call.
+_client = None
+
+# Async clients for event-loop callers, one per event loop: the client's
+# aio channel binds to the loop that first uses it, so a single module-wide
+# instance would break the moment a second asyncio.run() starts a new loop.
+# Weak keys let a client be dropped together with its garbage-collected loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncQdrantClient]" = weakref.WeakKeyDictionary()
+
+# Set once the collection has been verified or created; later calls skip the
+# per-upsert get_collection round trip.
+_collection_ready = False
+
+# Set only when this process created the collection with bulk_mode=True.
+# finalize_bulk_upsert checks it so a pre-existing collection - possibly
+# carrying operator-tuned optimizer settings - never has its
+# indexing_threshold overwritten by a run that didn't disable it.
+_bulk_collection_created = False
+
+# Chunk-record fields stored as point payload. The schema is stable (see
+# chunk_enricher.to_chunk_records), so enumerating the keys once beats a
+# per-chunk dict comprehension that re-filters every key against an
+# exclusion test for millions of chunks.
+PAYLOAD_KEYS = (
+    "chunk_id",
+    "chunk_index",
+    "chunk_text",
+    "doc_id",
+    "source",
+    "type",
+    "title",
+    "location",
+    "created_at",
+    "fetched_at",
+    "language",
+    "keywords",
+)
+
+# Specialized single-call extractor for the standard record schema: one C-level
+# itemgetter call replaces a per-key membership test and lookup loop.
+_get_payload = itemgetter(*PAYLOAD_KEYS)
+
+
+def _build_payload(chunk: dict) -> dict:
+    """
+    Builds a point payload from a chunk record without mutating it.
+
+    Fast path for records following the standard schema (one C-level
+    itemgetter call); partial records missing a schema key fall back to
+    the filtering comprehension.
+    """
+    try:
+        return dict(zip(PAYLOAD_KEYS, _get_payload(chunk)))
+    except KeyError:
+        return {key: chunk[key] for key in PAYLOAD_KEYS if key in chunk}
+
+
+def _get_client() -> QdrantClient:
+    """Returns the shared QdrantClient, constructing it on first use."""
+    global _client
+    if _client is None:
+        # A generous timeout keeps large bulk upserts and collection
+        # operations from tripping the client's default deadline.
+        # prefer_grpc sends vectors as packed protobuf floats instead of
+        # JSON text, roughly halving upsert payload bytes and encode CPU;
+        # 6334 is Qdrant's standard gRPC port alongside REST on 6333.
+        _client = QdrantClient(url=url, prefer_grpc=True, grpc_port=6334, timeout=60)
+    return _client
+
+
+def _get_async_client() -> AsyncQdrantClient:
+    """
+    Returns the AsyncQdrantClient for the running event loop.
+
+    One client is cached per loop rather than per module: its underlying
+    channel is tied to the loop that first drives it, so reusing a client
+    across asyncio.run() calls would leave later calls talking to a channel
+    bound to an already-closed loop. Must be called from within a running
+    loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncQdrantClient(url=url, prefer_grpc=True, grpc_port=6334, timeout=60)
+        _async_clients[loop] = client
+    return client
+
+def create_collection_if_not_exists(bulk_mode: bool = False) -> QdrantClient:
     """
     Creates a vector database collection if it doesn't already exist.
     
+    Args:
+        bulk_mode (bool, optional): Create the collection with optimizer
+            settings tuned for bulk loading: HNSW indexing deferred
+            (indexing_threshold=0), large segments (max_segment_size) so
+            the optimizer is not constantly re-segmenting and shuffling
+            data mid-upload, and a memmap threshold that moves big segments
+            off-heap. finalize_bulk_upsert() restores the indexing
+            threshold so the index is built once at the end. Defaults to
+            False.
+
     Returns:
         QdrantClient: Connected and configured Qdrant client instance
         
@@ -20,6 +138,10 @@ def create_collection_if_not_exists() -> QdrantClient:
     2. Checks if the configured collection already exists
     3. If not found, creates a new collection with proper vector configuration
     4. Returns the connected client for further operations
+
+    The client and the existence check are both cached at module scope, so
+    repeated calls on the indexing or serving hot path cost a flag test
+    rather than a round trip to the database.
     
     The collection is configured with:
     - Vector size from VECTOR_DB_EMBEDDING_SIZE environment variable
@@ -31,30 +153,72 @@ def create_collection_if_not_exists() -> QdrantClient:
         - VECTOR_DB_COLLECTION_NAME: Name of the collection to create/access
         - VECTOR_DB_EMBEDDING_SIZE: Dimension size of vector embeddings
     """
-    logger.info("create_collection_if_not_exists() function started")
-    client = QdrantClient(url)
-    
+    global _collection_ready, _bulk_collection_created
+    logger.debug("create_collection_if_not_exists() started")
+    client = _get_client()
+
+    if _collection_ready:
+        logger.debug("create_collection_if_not_exists() completed - collection already verified")
+        return client
+
     try:
         client.get_collection(collection_name)
         logger.info(f"Collection '{collection_name}' already exists")
     except Exception:
-        logger.info(f"Creating new collection '{collection_name}'")
+        logger.info(f"Creating new collection '{collection_name}' (bulk_mode={bulk_mode})")
         client.create_collection(
             collection_name=collection_name,
             vectors_config=models.VectorParams(size=VECTOR_DB_EMBEDDING_SIZE, distance=models.Distance.COSINE),
+            optimizers_config=models.OptimizersConfigDiff(
+                indexing_threshold=0,
+                memmap_threshold=20000,
+                max_segment_size=200000,
+            ) if bulk_mode else None,
         )
         logger.info(f"Collection '{collection_name}' created successfully")
-    
-    logger.info("create_collection_if_not_exists() function completed")
+        _bulk_collection_created = bulk_mode
+    _collection_ready = True
+
+    logger.debug("create_collection_if_not_exists() completed")
     return client
 
 
-def upsert_chunks(chunk_records: list[dict]):
+def finalize_bulk_upsert():
+    """
+    Re-enables HNSW indexing after a bulk load.
+
+    Call once after the last batch of a run that created the collection
+    with bulk_mode=True: restoring indexing_threshold lets the optimizer
+    build the vector index in one pass over the finished segments instead
+    of interleaving graph rebuilds with every write. A no-op when this
+    process did not create the collection in bulk mode, so existing
+    collections keep whatever optimizer settings they were configured with.
+    """
+    global _bulk_collection_created
+    logger.info("finalize_bulk_upsert() function started")
+    if not _bulk_collection_created:
+        logger.debug("finalize_bulk_upsert() skipped - collection was not bulk-created by this run")
+        return
+    client = _get_client()
+    client.update_collection(
+        collection_name=collection_name,
+        optimizer_config=models.OptimizersConfigDiff(indexing_threshold=20000),
+    )
+    _bulk_collection_created = False
+    logger.info(f"finalize_bulk_upsert() function completed - indexing re-enabled on '{collection_name}'")
+
+
+def upsert_chunks(chunk_records: list[dict], wait: bool = False):
     """
     Inserts or updates document chunks in the vector database.
     
     Args:
         chunk_records (list[dict]): List of chunk records containing embeddings and metadata
+        wait (bool, optional): Block until the server has fsynced each batch
+            to the WAL. The default returns as soon as a request is
+            accepted, letting the next batch queue while the server
+            flushes; pass True for the final batch of a job when
+            durability matters more than throughput. Defaults to False.
         
     This function:
     1. Ensures the target collection exists in the vector database
@@ -69,21 +233,152 @@ def upsert_chunks(chunk_records: list[dict]):
     
     The upsert operation allows for idempotent indexing - running the same
     chunks multiple times will update rather than duplicate entries.
+
+    The per-request batch size comes from UPSERT_BATCH_SIZE (default 512),
+    tunable per deployment to stay under the server's comfortable request
+    size.
+
+    Note: the records are consumed in place — the 'embedding' key is popped
+    off each one so the remaining dict can be sent as the payload without a
+    per-chunk copy. Callers needing the embeddings afterwards should use
+    upsert_chunks_async, which leaves its input untouched.
     """
-    logger.info(f"upsert_chunks() function started - processing {len(chunk_records)} chunks")
+    logger.debug("upsert_chunks() started - chunks=%d", len(chunk_records))
+    batch_size = int(utils.get_env_var("UPSERT_BATCH_SIZE", default="512"))
+    # Concurrent sender count. On the gRPC transport requests multiplex over
+    # one HTTP/2 channel, so (unlike REST) there is no httpx connection pool
+    # to widen - the throughput knob is how many uploader workers serialize
+    # and send batches at once. Default scales with the machine: 2x cores,
+    # capped to keep process fan-out sane.
+    parallel = int(utils.get_env_var(
+        "UPSERT_PARALLEL", default=str(min(2 * (os.cpu_count() or 2), 16))
+    ))
     client = create_collection_if_not_exists()
-    points = []
-    for chunk in chunk_records:
-        points.append(
+    # A generator keeps only one sub-batch of PointStructs alive at a time:
+    # upload_points consumes it lazily, so the full window never exists as a
+    # second materialized copy alongside the chunk records. As the final
+    # pipeline stage this function owns the records, so the embedding is
+    # popped in place and the record itself becomes the payload — no
+    # per-chunk dict rebuild. upsert_chunks_async copies instead, since its
+    # callers may reuse their records.
+    points = (
+        models.PointStruct(
+            id=chunk["chunk_id"],
+            vector=_as_vector(chunk.pop("embedding")),
+            payload=chunk,
+        )
+        for chunk in chunk_records
+    )
+    # upload_points splits the points into sub-batches and sends them from
+    # parallel workers, overlapping request serialization with server-side
+    # indexing; one monolithic upsert body risks timeouts and 413s on large
+    # windows (arbitrarily sized upserts are known to stall past a few
+    # thousand points). wait=False returns once the server has accepted the
+    # batch instead of blocking on the WAL fsync between batches.
+    client.upload_points(
+        collection_name=collection_name,
+        points=points,
+        batch_size=batch_size,
+        parallel=parallel,
+        wait=wait,
+    )
+    logger.info("upsert_chunks() completed - upserted %d chunks to '%s'", len(chunk_records), collection_name)
+
+
+
+
+
+
+def bulk_upsert_chunks(chunk_records: list[dict], parallel: int | None = None, batch_size: int = 64):
+    """
+    Upserts a large, fully materialized batch using worker processes.
+
+    Args:
+        chunk_records (list[dict]): List of chunk records containing embeddings and metadata
+        parallel (int | None, optional): Number of worker processes; defaults
+            to the machine's core count
+        batch_size (int, optional): Points per request from each worker.
+            Defaults to 64.
+
+    Python-side serialization of large vector payloads is CPU-bound and
+    GIL-limited in one process. upload_collection takes columnar input -
+    one stacked float32 matrix of vectors plus parallel id and payload
+    lists - and fans serialization and sending out across worker
+    processes, each with its own connection, so encode work scales with
+    cores. Prefer this over upsert_chunks when the whole batch is already
+    in memory; the records are not mutated.
+    """
+    logger.debug("bulk_upsert_chunks() started - chunks=%d", len(chunk_records))
+    client = create_collection_if_not_exists()
+    vectors = np.stack([_as_vector(chunk["embedding"]) for chunk in chunk_records])
+    client.upload_collection(
+        collection_name=collection_name,
+        vectors=vectors,
+        payload=[_build_payload(chunk) for chunk in chunk_records],
+        ids=[chunk["chunk_id"] for chunk in chunk_records],
+        parallel=parallel or os.cpu_count(),
+        batch_size=batch_size,
+        wait=False,
+    )
+    logger.info("bulk_upsert_chunks() completed - upserted %d chunks to '%s'", len(chunk_records), collection_name)
+
+
+async def upsert_chunks_async(chunk_records: list[dict], batch_size: int = 256, concurrency: int = 32):
+    """
+    Inserts or updates document chunks from an asyncio event loop.
+
+    Args:
+        chunk_records (list[dict]): List of chunk records containing embeddings and metadata
+        batch_size (int, optional): Points per upsert request. Defaults to 256.
+        concurrency (int, optional): Maximum upsert requests in flight. Defaults to 32.
+
+    Async counterpart of upsert_chunks: the records are split into
+    sub-batches which are fanned out concurrently with asyncio.gather, so
+    request serialization overlaps network latency and server-side work
+    across many in-flight requests instead of proceeding one blocking call
+    at a time. A semaphore caps the fan-out so a huge window cannot open
+    hundreds of simultaneous requests. The sync pipeline path keeps
+    upload_points, which provides the same overlap via worker processes;
+    this entry point serves callers already running on an event loop.
+    """
+    logger.debug("upsert_chunks_async() started - chunks=%d", len(chunk_records))
+    create_collection_if_not_exists()
+    client = _get_async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _upsert_batch(batch: list[dict]):
+        points = [
             models.PointStruct(
                 id=chunk["chunk_id"],
-                vector=chunk["embedding"],
-                payload={k: v for k, v in chunk.items() if k not in ("embedding")},
+                vector=_as_vector(chunk["embedding"]),
+                payload=_build_payload(chunk),
             )
-        )
-    client.upsert(collection_name=collection_name, points=points)
-    logger.info(f"upsert_chunks() function completed - upserted {len(chunk_records)} chunks to '{collection_name}'")
+            for chunk in batch
+        ]
+        async with semaphore:
+            await client.upsert(collection_name=collection_name, points=points, wait=False)
+
+    await asyncio.gather(*(_upsert_batch(batch) for batch in utils.batched(chunk_records, batch_size)))
+    logger.info("upsert_chunks_async() completed - upserted %d chunks to '%s'", len(chunk_records), collection_name)
+
 
+def upsert_chunks_concurrent(chunk_records: list[dict], batch_size: int = 256, concurrency: int = 32):
+    """
+    Sync wrapper around upsert_chunks_async for callers without an event loop.
 
+    Args:
+        chunk_records (list[dict]): List of chunk records containing embeddings and metadata
+        batch_size (int, optional): Points per upsert request. Defaults to 256.
+        concurrency (int, optional): Maximum upsert requests in flight. Defaults to 32.
+    """
+    asyncio.run(upsert_chunks_async(chunk_records, batch_size=batch_size, concurrency=concurrency))
 
 
+# Opt-in import-time warmup: spawning the connect + collection check on a
+# daemon thread overlaps it with the heavyweight imports (numpy, embedding
+# model) that follow, so the first real call finds the cached client and
+# verified collection already in place. Off by default - import side
+# effects are surprising and tests want a cold module - enable by setting
+# VECTOR_DB_WARM_ON_IMPORT=1.
+if utils.get_env_var("VECTOR_DB_WARM_ON_IMPORT", default="") == "1":
+    threading.Thread(target=create_collection_if_not_exists, daemon=True).start()
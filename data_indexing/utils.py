@@ -1,34 +1,96 @@
 import os
 import logging
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
 from dotenv import load_dotenv
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
-def get_env_var(key: str) -> str:
+_MISSING = object()
+
+# Whether the .env file has been merged into os.environ. Loading is deferred
+# to the first get_env_var call: load_dotenv walks the filesystem looking for
+# .env, and paying that at import time means every subprocess that imports
+# this module (e.g. upload_points workers) repeats the walk. Forked workers
+# inherit both the populated os.environ and this flag, so they skip the
+# re-read entirely.
+_env_loaded = False
+
+
+def _ensure_env():
+    """Loads the .env file into os.environ exactly once per process tree."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+@lru_cache(maxsize=None)
+def get_env_var(key: str, default: str = _MISSING) -> str:
     """
     Retrieves an environment variable value by key.
-    
+
     Args:
         key (str): The environment variable name to retrieve
-    
+        default (str, optional): Value returned when the variable is not set;
+            omit it to make the variable required
+
     Returns:
-        str: The value of the environment variable
-        
+        str: The value of the environment variable, or the default
+
     Raises:
-        ValueError: If the environment variable is not set
-        
+        ValueError: If the environment variable is not set and no default
+            was provided
+
     This function checks if the specified environment variable exists
-    and returns its value. If the variable is not found, raises a
-    descriptive error message.
+    and returns its value. If the variable is not found, returns the
+    default when one was given, otherwise raises a descriptive error.
+
+    Results are memoized: configuration is read many times per request on
+    the serving hot paths but never changes at runtime, so repeat lookups
+    cost a cache hit instead of an os.environ probe. Call
+    refresh_env_cache() after mutating os.environ (e.g., in tests).
     """
-    if key in os.environ:
-        value = os.environ[key]
-        return value
-    else:
+    _ensure_env()
+    # Single dict access instead of a membership test plus a getitem; the
+    # KeyError path only runs once per key thanks to the memoization above.
+    try:
+        return os.environ[key]
+    except KeyError:
+        if default is not _MISSING:
+            return default
         logger.error(f"get_env_var() function failed - Environment variable {key} is not set")
-        raise ValueError(f"Environment variable {key} is not set")
+        raise ValueError(f"Environment variable {key} is not set") from None
+
+
+def refresh_env_cache():
+    """
+    Clears the memoized environment lookups.
+
+    Needed after os.environ is mutated at runtime — for example by tests or
+    by a reconfiguration step — since get_env_var otherwise keeps returning
+    the values seen on first access.
+    """
+    get_env_var.cache_clear()
+
+
+def batched(iterable: Iterable, n: int) -> Iterator[list]:
+    """
+    Yields successive lists of up to n items from an iterable.
+
+    Args:
+        iterable (Iterable): Source of items to batch
+        n (int): Maximum number of items per batch
+
+    Yields:
+        list: The next batch of up to n items
+
+    Allows pipeline stages to consume generators in bounded windows so only
+    one batch of items needs to be materialized at a time.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
 
 
 
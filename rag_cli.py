@@ -1,10 +1,47 @@
 # rag_cli.py
-from data_indexing.rag_pipeline import anser_query
+from data_indexing.rag_pipeline import anser_query, answer_queries
+from data_indexing.embedder import warm_up_embedder
+from data_indexing.retriver import warm_up_retriever
+import argparse
+import asyncio
 import logging
+import sys
+import threading
 from data_indexing import utils
 
+try:
+    # Enables arrow-key editing and history in input(); optional because the
+    # module is unavailable on some platforms and nothing else needs it.
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
 logger = logging.getLogger(__name__)
 
+def run_batch(path: str):
+    """
+    Answers a file (or stdin) of queries through the batched RAG pipeline.
+
+    Args:
+        path (str): Path to a file with one query per line, or '-' for stdin
+
+    All queries are answered concurrently via answer_queries, so their
+    retrievals collapse into shared embed+search_batch calls and the LLM
+    requests overlap, instead of each query paying the full pipeline
+    latency in sequence.
+    """
+    stream = sys.stdin if path == "-" else open(path)
+    with stream:
+        queries = [line.strip() for line in stream if line.strip()]
+    if not queries:
+        logger.info("run_batch() - no queries to answer")
+        return
+    logger.info(f"run_batch() answering {len(queries)} queries")
+    answers = asyncio.run(answer_queries(queries))
+    for query, answer in zip(queries, answers):
+        print(f"Query: {query}\nResponse: \n{answer}\n")
+
+
 def main():
     """
     Main entry point for the RAG (Retrieval-Augmented Generation) CLI application.
@@ -15,14 +52,38 @@ def main():
     - Processes user queries using the RAG pipeline
     - Retrieves relevant document chunks and generates responses
     - Continues until user exits with 'exit', 'quit', or 'bye'
-    
+
+    With --batch FILE (or --batch - for stdin), all queries are read up
+    front and answered concurrently through the batched pipeline instead of
+    one at a time.
+
     Uses the configured LLM and vector database for response generation.
     """
+    parser = argparse.ArgumentParser(description="Query the indexed document collection")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="answer all queries from FILE (one per line, '-' for stdin) concurrently")
+    args = parser.parse_args()
+    if args.batch:
+        run_batch(args.batch)
+        return
+
     logger.info("Starting custom RAG LLM server...")
+    # Warm the embedding model and the vector-store channel in the
+    # background so loading overlaps the time the user spends typing the
+    # first query instead of blocking the prompt. The join before answering
+    # guarantees the warm state is ready (and built exactly once) before
+    # the pipeline needs it.
+    def _warm_up():
+        warm_up_embedder()
+        warm_up_retriever()
+
+    warmup = threading.Thread(target=_warm_up, daemon=True)
+    warmup.start()
     while True:
         query = input("How may I help you today? (type 'exit' to quit)")
         if query.lower() in ["exit", "quit", "bye"]:
             break
+        warmup.join()
         answer = anser_query(query)
         print(f"\nResponse: \n{answer}\n")
 